@@ -2,7 +2,19 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import csv
+import functools
+import itertools
+import os
 import sqlite3
+import threading
+
+try:
+    # Optional: parses large CSV imports in C++; the csv module is used when it is missing
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pv
+except ImportError:
+    pa = pc = pv = None
 
 ## @file main.py
 ## @brief Garment Inventory Management System - GUI and Database logic.
@@ -12,6 +24,126 @@ import sqlite3
 
 DB_NAME = 'garments.db'
 
+## @brief Connection tuning applied before the schema is created.
+## WAL lets readers proceed during writes and NORMAL sync avoids an fsync per commit.
+PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA busy_timeout=5000',
+)
+
+## @brief Columns that can be filtered on; each gets a case-insensitive index.
+FILTER_COLUMNS = ('name', 'size', 'color', 'style')
+
+## @brief Base query for listing garments; columns are named so the row layout never depends on the schema order.
+SELECT_GARMENTS = 'SELECT id, name, size, color, style, quantity FROM garments'
+
+## @brief Fixed query for the common name-only filter, which seeks on idx_garments_name.
+SELECT_BY_NAME = SELECT_GARMENTS + ' WHERE name = ? COLLATE NOCASE ORDER BY id'
+
+## @brief CSV files larger than this many bytes (roughly 10k rows) are imported with the filter indexes
+## dropped and rebuilt afterwards, which is cheaper than maintaining them row by row.
+REINDEX_IMPORT_SIZE = 300 * 1024
+
+## @brief Number of rows passed to each executemany call during a bulk insert.
+IMPORT_CHUNK_SIZE = 10000
+
+## @brief Largest quantity SQLite can store in an INTEGER column.
+MAX_QUANTITY = 2 ** 63 - 1
+
+## @brief Number of rows fetched into the table at a time; more are loaded on scroll.
+PAGE_SIZE = 200
+
+
+def valid_csv_rows(reader, stats):
+    """
+    @brief Lazily validate CSV rows and convert them to garment tuples for import.
+    @param reader Iterable of CSV rows (lists of strings).
+    @param stats Dictionary whose 'read' entry is incremented for every row consumed.
+    @return Generator of (name, size, color, style, quantity) tuples; invalid rows are skipped.
+    """
+    for row in reader:
+        stats['read'] += 1
+        if len(row) != 5:
+            continue
+        name, size, color, style, quantity = (value.strip() for value in row)
+        if not (name and size and color and style):
+            continue
+        quantity = parse_quantity(quantity)
+        if quantity is None:
+            continue
+        yield (name, size, color, style, quantity)
+
+
+def parse_quantity(text):
+    """
+    @brief Parse a quantity entered in the form or read from a CSV import.
+    @param text Quantity text.
+    @return The quantity as a non-negative int, or None if it is not one.
+    """
+    # ASCII digits with an optional leading '+', matching arrow_csv_rows; parsed once by int()
+    if not text.isascii() or '_' in text or '-' in text:
+        return None
+    try:
+        quantity = int(text)
+    except ValueError:
+        return None
+    # Larger values cannot be stored and would abort a whole bulk insert
+    return quantity if quantity <= MAX_QUANTITY else None
+
+
+def arrow_csv_rows(file_path, stats):
+    """
+    @brief Lazily read and validate a CSV file for import using pyarrow, one record batch at a time.
+    @param file_path Path of the CSV file.
+    @param stats Dictionary whose 'read' entry is incremented for every row consumed.
+    @return Generator of (name, size, color, style, quantity) tuples; invalid rows are skipped.
+    """
+    if not os.path.getsize(file_path):
+        return
+
+    def skip_invalid(row):
+        # Rows without exactly five fields
+        stats['read'] += 1
+        return 'skip'
+
+    columns = ('name', 'size', 'color', 'style', 'quantity')
+    reader = pv.open_csv(
+        file_path,
+        read_options=pv.ReadOptions(column_names=columns),
+        parse_options=pv.ParseOptions(invalid_row_handler=skip_invalid),
+        convert_options=pv.ConvertOptions(column_types={column: pa.string() for column in columns}),
+    )
+    for batch in reader:
+        stats['read'] += batch.num_rows
+        fields = [pc.utf8_trim_whitespace(batch.column(index)) for index in range(4)]
+        # Accept what int() accepts in valid_csv_rows: surrounding whitespace and a leading '+'
+        quantity = pc.utf8_trim_whitespace(batch.column(4))
+        valid = pc.match_substring_regex(quantity, '^\\+?[0-9]+$')
+        quantity = pc.replace_substring_regex(quantity, '^\\+', '')
+        # Skip values above MAX_QUANTITY like parse_quantity does; the int64 cast would fail on them.
+        # Without leading zeros, equal-length digit strings compare like the numbers they spell
+        digits = pc.replace_substring_regex(quantity, '^0+', '')
+        length = pc.utf8_length(digits)
+        in_range = pc.or_(
+            pc.less(length, len(str(MAX_QUANTITY))),
+            pc.and_(pc.equal(length, len(str(MAX_QUANTITY))), pc.less_equal(digits, str(MAX_QUANTITY))),
+        )
+        valid = pc.and_(valid, in_range)
+        for field in fields:
+            valid = pc.and_(valid, pc.greater(pc.utf8_length(field), 0))
+        quantities = pc.cast(pc.filter(quantity, valid), pa.int64()).to_pylist()
+        yield from zip(*(pc.filter(field, valid).to_pylist() for field in fields), quantities)
+
+
+class ImportCancelled(Exception):
+    """
+    @class ImportCancelled
+    @brief Raised inside a running CSV import when the user cancels it; the import is rolled back.
+    """
+
 
 class GarmentDB:
     """
@@ -23,14 +155,33 @@ class GarmentDB:
         """
         @brief Initialize the GarmentDB and create the garments table if it doesn't exist.
         """
-        self.conn = sqlite3.connect(DB_NAME)
+        # Keep prepared statements for every distinct SQL string the app issues
+        self.write_conn = sqlite3.connect(DB_NAME, cached_statements=256)
         self.create_table()
+        # Separate read-only connection; in WAL mode its queries do not wait behind writes
+        self.read_conn = sqlite3.connect(DB_NAME, cached_statements=256)
+        self.read_conn.row_factory = sqlite3.Row
+        for pragma in PRAGMAS + ('PRAGMA query_only=1',):
+            self.read_conn.execute(pragma)
+        # Filter SQL keyed by the set of active filter columns and whether paging is used
+        self._query_cache = {}
+        # Recent fetch results, so repeating a search while typing skips the database
+        self._fetch_cached = functools.lru_cache(maxsize=32)(self._fetch)
+
+    def close(self):
+        """
+        @brief Close both database connections.
+        """
+        self.read_conn.close()
+        self.write_conn.close()
 
     def create_table(self):
         """
-        @brief Create the garments table and add the quantity column if upgrading from an old DB.
+        @brief Apply PRAGMAs to the write connection, create the garments table and add the quantity column if upgrading from an old DB.
         """
-        self.conn.execute('''CREATE TABLE IF NOT EXISTS garments (
+        for pragma in PRAGMAS:
+            self.write_conn.execute(pragma)
+        self.write_conn.execute('''CREATE TABLE IF NOT EXISTS garments (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             size TEXT NOT NULL,
@@ -40,10 +191,25 @@ class GarmentDB:
         )''')
         # Add quantity column if upgrading from old DB
         try:
-            self.conn.execute('ALTER TABLE garments ADD COLUMN quantity INTEGER NOT NULL DEFAULT 0')
+            self.write_conn.execute('ALTER TABLE garments ADD COLUMN quantity INTEGER NOT NULL DEFAULT 0')
         except sqlite3.OperationalError:
             pass
-        self.conn.commit()
+        self.create_indexes()
+        self.write_conn.commit()
+
+    def create_indexes(self):
+        """
+        @brief Create the NOCASE indexes used by the search/filter queries.
+        """
+        for column in FILTER_COLUMNS:
+            self.write_conn.execute(f'CREATE INDEX IF NOT EXISTS idx_garments_{column} ON garments({column} COLLATE NOCASE)')
+
+    def drop_indexes(self):
+        """
+        @brief Drop the filter indexes, e.g. before a large bulk insert.
+        """
+        for column in FILTER_COLUMNS:
+            self.write_conn.execute(f'DROP INDEX IF EXISTS idx_garments_{column}')
 
     def add_garment(self, name, size, color, style, quantity):
         """
@@ -53,19 +219,55 @@ class GarmentDB:
         @param color Color of the garment.
         @param style Style of the garment.
         @param quantity Quantity in stock.
-        @return True if added, False if duplicate or error.
+        @return ID of the new garment if added, False if duplicate or error.
         """
         try:
             # Prevent duplicate (name, size, color, style) entries
-            cursor = self.conn.execute('SELECT COUNT(*) FROM garments WHERE name=? AND size=? AND color=? AND style=?', (name, size, color, style))
+            cursor = self.write_conn.execute('SELECT COUNT(*) FROM garments WHERE name=? AND size=? AND color=? AND style=?', (name, size, color, style))
             if cursor.fetchone()[0] > 0:
                 return False
-            self.conn.execute('INSERT INTO garments (name, size, color, style, quantity) VALUES (?, ?, ?, ?, ?)', (name, size, color, style, quantity))
-            self.conn.commit()
-            return True
+            cursor = self.write_conn.execute('INSERT INTO garments (name, size, color, style, quantity) VALUES (?, ?, ?, ?, ?)', (name, size, color, style, quantity))
+            self.write_conn.commit()
+            self.clear_cache()
+            return cursor.lastrowid
         except Exception:
             return False
 
+    def add_garments_bulk(self, rows, rebuild_indexes=False, progress=None):
+        """
+        @brief Add many garments in a single transaction, skipping duplicates.
+        @param rows Iterable of (name, size, color, style, quantity) tuples; consumed in chunks of IMPORT_CHUNK_SIZE.
+        @param rebuild_indexes Drop the filter indexes for the insert and recreate them before committing.
+        @param progress Optional callable receiving the number of garments added so far after each chunk.
+        @return Number of garments added.
+        """
+        with self.write_conn:
+            # Take the write lock up front so the index DDL, the duplicate-key snapshot and
+            # the inserts all run in one transaction that no other writer can interleave with
+            self.write_conn.execute('BEGIN IMMEDIATE')
+            if rebuild_indexes:
+                self.drop_indexes()
+            # Load existing keys once instead of querying for duplicates per row
+            seen = set(self.write_conn.execute('SELECT name, size, color, style FROM garments'))
+
+            def new_rows():
+                for row in rows:
+                    key = row[:4]
+                    if key not in seen:
+                        seen.add(key)
+                        yield row
+
+            count = 0
+            pending = new_rows()
+            for chunk in iter(lambda: list(itertools.islice(pending, IMPORT_CHUNK_SIZE)), []):
+                count += self.write_conn.executemany('INSERT INTO garments (name, size, color, style, quantity) VALUES (?, ?, ?, ?, ?)', chunk).rowcount
+                if progress is not None:
+                    progress(count)
+            if rebuild_indexes:
+                self.create_indexes()
+        self.clear_cache()
+        return count
+
     def update_garment(self, garment_id, name, size, color, style, quantity):
         """
         @brief Update an existing garment in the database by ID.
@@ -76,39 +278,100 @@ class GarmentDB:
         @param style Updated style.
         @param quantity Updated quantity.
         """
-        self.conn.execute('UPDATE garments SET name=?, size=?, color=?, style=?, quantity=? WHERE id=?', (name, size, color, style, quantity, garment_id))
-        self.conn.commit()
+        self.write_conn.execute('UPDATE garments SET name=?, size=?, color=?, style=?, quantity=? WHERE id=?', (name, size, color, style, quantity, garment_id))
+        self.write_conn.commit()
+        self.clear_cache()
 
     def delete_garment(self, garment_id):
         """
         @brief Delete a garment from the database by ID.
         @param garment_id ID of the garment to delete.
         """
-        self.conn.execute('DELETE FROM garments WHERE id=?', (garment_id,))
-        self.conn.commit()
+        self.write_conn.execute('DELETE FROM garments WHERE id=?', (garment_id,))
+        self.write_conn.commit()
+        self.clear_cache()
 
-    def fetch_garments(self, filters=None):
+    def clear_cache(self):
+        """
+        @brief Discard cached fetch results after the garments table has changed.
+        """
+        self._fetch_cached.cache_clear()
+
+    @staticmethod
+    def escape_like(value):
+        """
+        @brief Escape LIKE wildcards in user input so they match literally.
+        @param value Raw filter text.
+        @return Text safe to embed in a LIKE pattern with ESCAPE '\\'.
+        """
+        return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+    def fetch_garments(self, filters=None, contains=False, limit=None, offset=0):
         """
         @brief Fetch garments from the database, optionally filtered by the provided criteria.
         @param filters Dictionary of filter criteria (name, size, color, style).
-        @return List of garment records.
-        """
-        query = 'SELECT * FROM garments'
-        params = []
-        if filters:
+        @param contains Match size/color/style anywhere in the value instead of as a prefix (cannot use the indexes).
+        @param limit Maximum number of records to return, or None for all.
+        @param offset Number of matching records to skip when limit is given.
+        @return List of garment records ordered by ID.
+        """
+        if not filters or not any(filters.values()):
+            # Unfiltered view: skip building criteria and share one cache entry regardless of contains
+            return list(self._fetch_cached((), False, limit, offset))
+        criteria = tuple((key, filters[key]) for key in FILTER_COLUMNS if filters.get(key))
+        return list(self._fetch_cached(criteria, contains, limit, offset))
+
+    def fetch_by_name(self, name, limit=None, offset=0):
+        """
+        @brief Fetch garments whose name matches exactly (ignoring case) using a fixed prepared statement.
+        @param name Garment name.
+        @param limit Maximum number of records to return, or None for all.
+        @param offset Number of matching records to skip when limit is given.
+        @return List of garment records ordered by ID.
+        """
+        if limit is None:
+            return self.read_conn.execute(SELECT_BY_NAME, (name,)).fetchall()
+        return self.read_conn.execute(SELECT_BY_NAME + ' LIMIT ? OFFSET ?', (name, limit, offset)).fetchall()
+
+    def _fetch(self, criteria, contains, limit, offset):
+        """
+        @brief Run the filter query for fetch_garments; results are memoized by the caller.
+        @param criteria Tuple of (column, value) pairs for the active filters.
+        @param contains Match size/color/style anywhere in the value instead of as a prefix.
+        @param limit Maximum number of records to return, or None for all.
+        @param offset Number of matching records to skip when limit is given.
+        @return Tuple of garment records ordered by ID.
+        """
+        if len(criteria) == 1 and criteria[0][0] == 'name':
+            return tuple(self.fetch_by_name(criteria[0][1], limit, offset))
+        active = [key for key, _ in criteria]
+        cache_key = (frozenset(active), limit is not None)
+        query = self._query_cache.get(cache_key)
+        if query is None:
+            query = SELECT_GARMENTS
             clauses = []
-            for key, value in filters.items():
-                if value:
-                    if key == 'name':
-                        clauses.append(f"{key} = ?")
-                        params.append(value)
-                    else:
-                        clauses.append(f"{key} LIKE ?")
-                        params.append(f"%{value}%")
+            for key in active:
+                if key == 'name':
+                    clauses.append(f"{key} = ? COLLATE NOCASE")
+                else:
+                    clauses.append(f"{key} LIKE ? ESCAPE '\\'")
             if clauses:
                 query += ' WHERE ' + ' AND '.join(clauses)
-        cursor = self.conn.execute(query, params)
-        return cursor.fetchall()
+            query += ' ORDER BY id'
+            if limit is not None:
+                query += ' LIMIT ? OFFSET ?'
+            self._query_cache[cache_key] = query
+        params = []
+        for key, value in criteria:
+            if key == 'name':
+                params.append(value)
+            else:
+                pattern = self.escape_like(value) + '%'
+                params.append('%' + pattern if contains else pattern)
+        if limit is not None:
+            params += [limit, offset]
+        cursor = self.read_conn.execute(query, params)
+        return tuple(cursor.fetchall())
 
 
 class GarmentApp:
@@ -125,6 +388,14 @@ class GarmentApp:
         self.db = GarmentDB()
         self.root = root
         self.root.title('Garment Inventory Management')
+        # Rows currently shown in the table, keyed by garment ID (also the Treeview iid)
+        self._row_cache = {}
+        self._filters = None
+        self._filtered = False
+        self._contains = False
+        self._exhausted = True
+        self._resize_pending = False
+        self._filter_after = None
         self.create_widgets()
         self.refresh_table()
 
@@ -142,6 +413,7 @@ class GarmentApp:
         self.filter_size = tk.StringVar()
         self.filter_color = tk.StringVar()
         self.filter_style = tk.StringVar()
+        self.filter_contains = tk.BooleanVar()
         ttk.Label(filter_frame, text='Name:').grid(row=0, column=0, sticky='e')
         ttk.Entry(filter_frame, textvariable=self.filter_name, width=15).grid(row=0, column=1, padx=2)
         ttk.Label(filter_frame, text='Size:').grid(row=0, column=2, sticky='e')
@@ -150,8 +422,13 @@ class GarmentApp:
         ttk.Entry(filter_frame, textvariable=self.filter_color, width=10).grid(row=0, column=5, padx=2)
         ttk.Label(filter_frame, text='Style:').grid(row=0, column=6, sticky='e')
         ttk.Entry(filter_frame, textvariable=self.filter_style, width=10).grid(row=0, column=7, padx=2)
-        ttk.Button(filter_frame, text='Search', command=self.apply_filter).grid(row=0, column=8, padx=5)
-        ttk.Button(filter_frame, text='Clear', command=self.clear_filter).grid(row=0, column=9, padx=5)
+        ttk.Checkbutton(filter_frame, text='Contains', variable=self.filter_contains, command=self.schedule_filter).grid(row=0, column=8, padx=2)
+        ttk.Button(filter_frame, text='Search', command=self.apply_filter).grid(row=0, column=9, padx=5)
+        ttk.Button(filter_frame, text='Clear', command=self.clear_filter).grid(row=0, column=10, padx=5)
+        # Filter as the user types, once they pause
+        for child in filter_frame.winfo_children():
+            if isinstance(child, ttk.Entry):
+                child.bind('<KeyRelease>', self.schedule_filter)
 
         # Form
         form_frame = ttk.LabelFrame(frame, text='Garment Details')
@@ -171,14 +448,25 @@ class GarmentApp:
         ttk.Entry(form_frame, textvariable=self.style_var, width=20).grid(row=1, column=3, padx=5, pady=2)
         ttk.Label(form_frame, text='Quantity:').grid(row=2, column=0, sticky='e')
         ttk.Entry(form_frame, textvariable=self.quantity_var, width=20).grid(row=2, column=1, padx=5, pady=2)
-        ttk.Button(form_frame, text='Add', command=self.add_garment).grid(row=3, column=0, pady=5)
-        ttk.Button(form_frame, text='Update', command=self.update_garment).grid(row=3, column=1, pady=5)
-        ttk.Button(form_frame, text='Delete', command=self.delete_garment).grid(row=3, column=2, pady=5)
+        # Write buttons are disabled while a CSV import holds the database write lock
+        self.write_buttons = (
+            ttk.Button(form_frame, text='Add', command=self.add_garment),
+            ttk.Button(form_frame, text='Update', command=self.update_garment),
+            ttk.Button(form_frame, text='Delete', command=self.delete_garment),
+        )
+        for column, button in enumerate(self.write_buttons):
+            button.grid(row=3, column=column, pady=5)
         ttk.Button(form_frame, text='Clear', command=self.clear_form).grid(row=3, column=3, pady=5)
 
         # Import Button
-        import_btn = ttk.Button(frame, text='Import CSV', command=self.import_csv)
-        import_btn.pack(pady=5)
+        import_frame = ttk.Frame(frame)
+        import_frame.pack(pady=5)
+        self.import_btn = ttk.Button(import_frame, text='Import CSV', command=self.import_csv)
+        self.import_btn.pack(side='left', padx=5)
+        self.cancel_import_btn = ttk.Button(import_frame, text='Cancel Import', command=self.cancel_import, state='disabled')
+        self.cancel_import_btn.pack(side='left', padx=5)
+        self.import_status = tk.StringVar()
+        ttk.Label(import_frame, textvariable=self.import_status).pack(side='left', padx=5)
 
         # Table
         self.tree = ttk.Treeview(frame, columns=('ID', 'Name', 'Size', 'Color', 'Style', 'Quantity'), show='headings')
@@ -187,19 +475,29 @@ class GarmentApp:
             self.tree.column(col, width=100, anchor='center')
         self.tree.pack(fill='both', expand=True, pady=10)
         self.tree.bind('<<TreeviewSelect>>', self.on_tree_select)
+        # Load further pages lazily as the view scrolls towards the end
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
 
         # Responsive: Bind window resize event
-        self.root.bind('<Configure>', self.on_window_resize)
+        self.root.bind('<Configure>', self.schedule_resize)
+
+    def schedule_resize(self, event=None):
+        """
+        @brief Recalculate column widths once, after the current burst of resize events or table updates.
+        """
+        if not self._resize_pending:
+            self._resize_pending = True
+            self.root.after_idle(self.on_window_resize)
 
     def on_window_resize(self, event=None):
         """
         @brief Recalculate column widths based on the longest cell content when the window is resized.
         """
+        self._resize_pending = False
         # Get all data in the treeview
         col_names = ('ID', 'Name', 'Size', 'Color', 'Style', 'Quantity')
         max_lens = {col: len(col) for col in col_names}
-        for row_id in self.tree.get_children():
-            values = self.tree.item(row_id)['values']
+        for values in self._row_cache.values():
             for idx, col in enumerate(col_names):
                 val = str(values[idx])
                 if len(val) > max_lens[col]:
@@ -228,31 +526,85 @@ class GarmentApp:
         )
         if not file_path:
             return
-        count = 0
-        skipped = 0
+        # Run the import on a worker thread so the GUI stays responsive
+        self._import_cancel = threading.Event()
+        self.import_btn.configure(state='disabled')
+        self.cancel_import_btn.configure(state='normal')
+        for button in self.write_buttons:
+            button.configure(state='disabled')
+        self.import_status.set('Importing...')
+        threading.Thread(target=self._do_import, args=(file_path,), daemon=True).start()
+
+    def cancel_import(self):
+        """
+        @brief Ask the running CSV import to stop; nothing it inserted is kept.
+        """
+        self._import_cancel.set()
+        self.cancel_import_btn.configure(state='disabled')
+
+    def _do_import(self, file_path):
+        """
+        @brief Import garments from a CSV file; runs on a worker thread.
+        @param file_path Path of the CSV file to import.
+        """
+        stats = {'read': 0}
         try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.reader(csvfile)
-                for row in reader:
-                    if len(row) != 5:
-                        skipped += 1
-                        continue  # skip invalid rows
-                    name, size, color, style, quantity = row
-                    if not name.strip() or not size.strip() or not color.strip() or not style.strip() or not quantity.strip():
-                        skipped += 1
-                        continue
-                    if not quantity.isdigit() or int(quantity) < 0:
-                        skipped += 1
-                        continue
-                    added = self.db.add_garment(name.strip(), size.strip(), color.strip(), style.strip(), int(quantity))
-                    if added:
-                        count += 1
-                    else:
-                        skipped += 1
-            self.refresh_table()
-            messagebox.showinfo('Import Complete', f'Successfully imported {count} garments. Skipped {skipped} invalid or duplicate rows.')
+            # SQLite connections cannot be shared across threads, so the worker opens its own
+            db = GarmentDB()
+            try:
+                # Rows are parsed, validated and inserted as a stream
+                rebuild_indexes = os.path.getsize(file_path) > REINDEX_IMPORT_SIZE
+
+                def progress(added):
+                    self.root.after(0, self.import_status.set, f'Importing... {stats["read"]} rows read, {added} added')
+
+                if pv is not None:
+                    rows = self._watch_import(arrow_csv_rows(file_path, stats))
+                    count = db.add_garments_bulk(rows, rebuild_indexes, progress)
+                else:
+                    with open(file_path, newline='', encoding='utf-8') as csvfile:
+                        rows = self._watch_import(valid_csv_rows(csv.reader(csvfile), stats))
+                        count = db.add_garments_bulk(rows, rebuild_indexes, progress)
+            finally:
+                db.close()
         except Exception as e:
-            messagebox.showerror('Import Failed', f'Error: {e}')
+            self.root.after(0, self._finish_import, 0, 0, e)
+            return
+        self.root.after(0, self._finish_import, count, stats['read'] - count, None)
+
+    def _watch_import(self, rows):
+        """
+        @brief Pass import rows through, stopping if the import is cancelled.
+        @param rows Iterable of validated garment tuples.
+        @return Generator of the same rows.
+        """
+        for row in rows:
+            if self._import_cancel.is_set():
+                raise ImportCancelled()
+            yield row
+
+    def _finish_import(self, count, skipped, error):
+        """
+        @brief Report the outcome of a CSV import and refresh the table; runs on the main thread.
+        @param count Number of garments imported.
+        @param skipped Number of invalid or duplicate rows skipped.
+        @param error Exception that ended the import, or None on success.
+        """
+        self.import_btn.configure(state='normal')
+        self.cancel_import_btn.configure(state='disabled')
+        for button in self.write_buttons:
+            button.configure(state='normal')
+        self.import_status.set('')
+        if isinstance(error, ImportCancelled):
+            self.import_status.set('Import cancelled.')
+            return
+        if error is not None:
+            messagebox.showerror('Import Failed', f'Error: {error}')
+            return
+        # The import wrote through another connection, so cached results are stale
+        self.db.clear_cache()
+        self.refresh_table()
+        messagebox.showinfo('Import Complete', f'Successfully imported {count} garments. Skipped {skipped} invalid or duplicate rows.')
 
     def add_garment(self):
         """
@@ -266,14 +618,15 @@ class GarmentApp:
         if not (name and size and color and style and quantity):
             messagebox.showwarning('Input Error', 'All fields are required.')
             return
-        if not quantity.isdigit() or int(quantity) < 0:
+        quantity = parse_quantity(quantity)
+        if quantity is None:
             messagebox.showwarning('Input Error', 'Quantity must be a non-negative integer.')
             return
-        added = self.db.add_garment(name, size, color, style, int(quantity))
-        if not added:
+        garment_id = self.db.add_garment(name, size, color, style, quantity)
+        if not garment_id:
             messagebox.showwarning('Duplicate/Error', 'This garment already exists or there was a database error.')
             return
-        self.refresh_table()
+        self.show_garment((garment_id, name, size, color, style, quantity))
         self.clear_form()
 
     def update_garment(self):
@@ -284,7 +637,7 @@ class GarmentApp:
         if not selected:
             messagebox.showwarning('Select a record', 'No garment selected.')
             return
-        garment_id = self.tree.item(selected[0])['values'][0]
+        garment_id = int(selected[0])
         name = self.name_var.get().strip()
         size = self.size_var.get().strip()
         color = self.color_var.get().strip()
@@ -293,15 +646,16 @@ class GarmentApp:
         if not (name and size and color and style and quantity):
             messagebox.showwarning('Input Error', 'All fields are required.')
             return
-        if not quantity.isdigit() or int(quantity) < 0:
+        quantity = parse_quantity(quantity)
+        if quantity is None:
             messagebox.showwarning('Input Error', 'Quantity must be a non-negative integer.')
             return
         try:
-            self.db.update_garment(garment_id, name, size, color, style, int(quantity))
+            self.db.update_garment(garment_id, name, size, color, style, quantity)
         except Exception as e:
             messagebox.showerror('Update Error', f'Could not update garment: {e}')
             return
-        self.refresh_table()
+        self.show_garment((garment_id, name, size, color, style, quantity))
         self.clear_form()
 
     def delete_garment(self):
@@ -312,11 +666,11 @@ class GarmentApp:
         if not selected:
             messagebox.showwarning('Select a record', 'No garment selected.')
             return
-        garment_id = self.tree.item(selected[0])['values'][0]
+        garment_id = int(selected[0])
         try:
             if messagebox.askyesno('Confirm Delete', 'Delete selected garment?'):
                 self.db.delete_garment(garment_id)
-                self.refresh_table()
+                self.remove_garment(garment_id)
                 self.clear_form()
         except Exception as e:
             messagebox.showerror('Delete Error', f'Could not delete garment: {e}')
@@ -335,18 +689,103 @@ class GarmentApp:
     def refresh_table(self, filters=None):
         """
         @brief Refresh the table view with garments from the database, optionally filtered.
+        Only the first page is fetched, or as many rows as were already loaded for the same filters.
         @param filters Dictionary of filter criteria (optional).
         """
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        for garment in self.db.fetch_garments(filters):
-            self.tree.insert('', 'end', values=garment)
-        self.on_window_resize()
+        contains = self.filter_contains.get()
+        limit = PAGE_SIZE
+        if filters == self._filters and contains == self._contains:
+            limit = max(limit, len(self._row_cache))
+        rows = {row['id']: self.garment_values(row) for row in self.db.fetch_garments(filters, contains, limit)}
+        # Only touch the Treeview for rows that were removed, added or changed
+        removed = [str(garment_id) for garment_id in self._row_cache if garment_id not in rows]
+        if removed:
+            self.tree.delete(*removed)
+        for index, (garment_id, garment) in enumerate(rows.items()):
+            cached = self._row_cache.get(garment_id)
+            if cached is None:
+                self.tree.insert('', index, iid=str(garment_id), values=garment)
+            elif cached != garment:
+                self.tree.item(str(garment_id), values=garment)
+        self._row_cache = rows
+        self._filters = filters
+        self._filtered = bool(filters and any(filters.values()))
+        self._contains = contains
+        self._exhausted = len(rows) < limit
+        self.schedule_resize()
+
+    @staticmethod
+    def garment_values(row):
+        """
+        @brief Convert a database row to the tuple of values shown in the table.
+        @param row sqlite3.Row for a garment.
+        @return Tuple (id, name, size, color, style, quantity).
+        """
+        return (row['id'], row['name'], row['size'], row['color'], row['style'], row['quantity'])
+
+    def load_more(self):
+        """
+        @brief Append the next page of garments for the current filters to the table view.
+        """
+        if self._exhausted:
+            return
+        rows = self.db.fetch_garments(self._filters, self._contains, PAGE_SIZE, len(self._row_cache))
+        for row in rows:
+            garment = self.garment_values(row)
+            self.tree.insert('', 'end', iid=str(row['id']), values=garment)
+            self._row_cache[row['id']] = garment
+        self._exhausted = len(rows) < PAGE_SIZE
+        self.schedule_resize()
+
+    def on_tree_scroll(self, first, last):
+        """
+        @brief Load the next page once the end of the loaded rows comes into view.
+        @param first Fraction of the rows above the visible area.
+        @param last Fraction of the rows up to the bottom of the visible area.
+        """
+        if float(last) > 0.9:
+            self.load_more()
+
+    def show_garment(self, garment):
+        """
+        @brief Show an added or updated garment without refetching the whole table.
+        @param garment Garment record (id, name, size, color, style, quantity).
+        """
+        if self._filtered:
+            # The row may no longer match the filter; fall back to the unfiltered view
+            self.refresh_table()
+            return
+        iid = str(garment[0])
+        if garment[0] in self._row_cache:
+            self.tree.item(iid, values=garment)
+        elif self._exhausted:
+            self.tree.insert('', 'end', iid=iid, values=garment)
+        else:
+            # New rows sort last; the next page will pick it up
+            return
+        self._row_cache[garment[0]] = garment
+        self.schedule_resize()
+
+    def remove_garment(self, garment_id):
+        """
+        @brief Remove a deleted garment from the table view without refetching.
+        @param garment_id ID of the deleted garment.
+        """
+        if self._filtered:
+            self.refresh_table()
+            return
+        if self._row_cache.pop(garment_id, None) is not None:
+            self.tree.delete(str(garment_id))
+        self.schedule_resize()
 
     def apply_filter(self):
         """
         @brief Apply the current filter fields to the garment table view.
         """
+        if self._filter_after is not None:
+            # Drop a pending debounced run; this one supersedes it
+            self.root.after_cancel(self._filter_after)
+            self._filter_after = None
         filters = {
             'name': self.filter_name.get().strip(),
             'size': self.filter_size.get().strip(),
@@ -355,10 +794,23 @@ class GarmentApp:
         }
         self.refresh_table(filters)
 
+    def schedule_filter(self, event=None):
+        """
+        @brief Apply the filter 150 ms after the last keystroke in a filter field or a change of the Contains option.
+        @param event Tkinter event object.
+        """
+        if self._filter_after is not None:
+            self.root.after_cancel(self._filter_after)
+        self._filter_after = self.root.after(150, self.apply_filter)
+
     def clear_filter(self):
         """
         @brief Clear all filter fields and refresh the table view.
         """
+        if self._filter_after is not None:
+            # Drop a pending debounced run so it does not fire after the clear
+            self.root.after_cancel(self._filter_after)
+            self._filter_after = None
         self.filter_name.set('')
         self.filter_size.set('')
         self.filter_color.set('')
@@ -373,7 +825,8 @@ class GarmentApp:
         selected = self.tree.selection()
         if not selected:
             return
-        garment = self.tree.item(selected[0])['values']
+        # The iid is the garment ID, so read the values from the cache instead of the widget
+        garment = self._row_cache[int(selected[0])]
         self.name_var.set(garment[1])
         self.size_var.set(garment[2])
         self.color_var.set(garment[3])